@@ -12,21 +12,56 @@ It's not my fault. Check https://github.com/matplotlib/matplotlib/issues/5209 .
 A fix should be released soon
 """
 
+import os
+import sys
 import matplotlib
+# Without a display GUI backends can't be used, and only slow down scripts
+# that save plots to files. Must be selected before importing pyplot, and
+# only if the user didn't pick a backend with MPLBACKEND or matplotlib.use.
+# The raw dict lookup reads the backend without making matplotlib resolve it.
+headless = not any(os.environ.get(name) for name in ('DISPLAY', 'WAYLAND_DISPLAY', 'MPLBACKEND'))
+backend_chosen = ('matplotlib.pyplot' in sys.modules
+                  or dict.__getitem__(matplotlib.rcParams, 'backend') != matplotlib.rcParamsOrig['backend'])
+if headless and not backend_chosen and sys.platform not in ('win32', 'darwin'):
+    matplotlib.use('Agg')
 from matplotlib import pyplot
-from collections import defaultdict, Counter
+from collections import defaultdict
+from itertools import chain, islice
+import copy
 import math
+import numpy as np
 
 # For flexibility purposes we accept a lot of data formats.
-# This helps distinguishing them.
-is_list = lambda a: hasattr(a, '__iter__') and not isinstance(a, str)
-
-# Use ggplot style, which I personally find much better than the default.
-pyplot.style.use('ggplot')
-
-# Draws axis ticks outside the axis line. Not necessary if using ggplot style.
-#matplotlib.rcParams['xtick.direction'] = 'out'
-#matplotlib.rcParams['ytick.direction'] = 'out'
+# This helps distinguishing them. The common sequence types are checked
+# first with a single isinstance, before falling back to duck typing.
+sequence_types = (list, tuple, type(range(0)), np.ndarray)
+def is_list(a):
+    return isinstance(a, sequence_types) or (hasattr(a, '__iter__') and not isinstance(a, str))
+
+# Hide frame lines on top and right sides, ensure ticks only on left and
+# bottom, and draw them outside the axis line. Can also be used with
+# `pyplot.style.context` for figures not made by this module.
+tufte_style = {
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'xtick.top': False,
+    'ytick.right': False,
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+}
+
+# Use ggplot style, which I personally find much better than the default,
+# with the settings above on top. Applied once here, so new axes are already
+# created this way.
+pyplot.style.use(['ggplot', tufte_style])
+
+# Format templates by number of decimal digits, reused across tick renders.
+# A plain dict because functools.lru_cache is not available in Python 2.
+number_templates = {}
+
+# Colormaps by name, so each is looked up only once. Never handed out
+# directly, since colormaps are mutable (e.g. `set_bad`).
+colormaps = {}
 
 def format_number(n, width, prefix='', suffix='', percentage=False):
     if percentage:
@@ -36,20 +71,106 @@ def format_number(n, width, prefix='', suffix='', percentage=False):
         return '{:,d}'.format(int(n))
 
     decimal_digits = max(0, int(-math.log10(width)+2), int(-math.log10(abs(n) or 1)))
-    format = '{' + ':0,.{}f'.format(decimal_digits) + '}'
+    format = number_templates.get(decimal_digits)
+    if format is None:
+        format = number_templates[decimal_digits] = '{' + ':0,.{}f'.format(decimal_digits) + '}'
     return prefix + format.format(n) + suffix
 
 def min_max_dif(values):
-    sorted_values = sorted(set(values))
+    # np.unique sorts and deduplicates in C, much faster than sorted(set()).
+    sorted_values = np.unique(values)
     if len(sorted_values) < 2:
         return 0, 0
-    difs = [abs(b - a) for a, b in zip(sorted_values, sorted_values[1:])]
-    return min(difs), sorted_values[-1] - sorted_values[0]
+    if sorted_values.dtype.kind == 'b':
+        # NumPy can't subtract booleans.
+        sorted_values = sorted_values.astype(int)
+    min_dif = np.diff(sorted_values).min()
+    max_dif = sorted_values[-1] - sorted_values[0]
+    # Back to plain Python numbers, unless they already are (e.g. Fraction).
+    return [getattr(n, 'item', lambda: n)() for n in (min_dif, max_dif)]
+
+def has_duplicates(sorted_items):
+    """
+    Returns True if any item appears more than once in the given sorted
+    sequence.
+    """
+    if isinstance(sorted_items, np.ndarray):
+        # Repetitions are neighbours, compared all at once in C.
+        return len(sorted_items) > 1 and bool(np.any(sorted_items[1:] == sorted_items[:-1]))
+    return len(set(sorted_items)) != len(sorted_items)
+
+def unzip(pairs):
+    """ Splits a list of (key, value) pairs into a list of keys and a list of values. """
+    return [k for k, _ in pairs], [v for _, v in pairs]
+
+def as_array(items):
+    """
+    Converts a sequence of numbers to a NumPy array. Anything else, like
+    labels or node names mixed with None, stays a list, because NumPy would
+    coerce mixed types to strings.
+    """
+    try:
+        array = np.asarray(items)
+    except ValueError:
+        # Ragged nested sequences.
+        return list(items)
+    if array.dtype.kind in 'biuf':
+        return array
+    return list(items)
+
+def count(samples, bin):
+    """
+    Groups the samples in bins of size `bin`, returning the sorted bin
+    starts and the number of samples in each, for every non-empty bin.
+    """
+    samples = np.asarray(samples)
+    if not len(samples):
+        return [], []
+
+    if samples.dtype.kind == 'i' and bin == 1:
+        # Each integer is its own bin. np.unique needs no division and, unlike
+        # bincount, doesn't allocate the whole range for sparse samples.
+        return np.unique(samples, return_counts=True)
+
+    # Counting is done by NumPy in a single pass, instead of hashing every
+    # sample in Python.
+    if samples.dtype.kind == 'i' and int(bin) == bin:
+        # Integer division is exact and needs no float conversion.
+        index = lambda values: values // int(bin)
+    elif samples.dtype == object:
+        # Fraction, Decimal, etc. can't be floored by NumPy.
+        index = np.vectorize(lambda value: int(math.floor(value / bin)), otypes=[np.int64])
+    else:
+        # Multiplying by the inverse is much cheaper than dividing every sample.
+        inverse = 1.0 / bin
+        index = lambda values: np.floor(values * inverse).astype(np.int64)
+
+    # The bin index grows with the sample, so the extremes give its range.
+    smallest, largest = samples.min(), samples.max()
+    if samples.dtype.kind == 'f' and not np.isfinite([smallest, largest]).all():
+        # NaN propagates to the extremes, so checking them covers every sample.
+        raise ValueError('Invalid samples: NaN and infinity have no bin')
+    lowest = int(index(smallest))
+    highest = int(index(largest))
+    if lowest == highest:
+        # Everything in a single bin (e.g. a constant signal), no need to
+        # index every sample.
+        return np.array([lowest * bin]), np.array([len(samples)])
+
+    if highest - lowest > 2 * len(samples):
+        # Sparse samples, bincount would allocate the whole range.
+        indexes, counts = np.unique(index(samples), return_counts=True)
+        return indexes * bin, counts
+
+    counts = np.bincount(index(samples) - lowest)
+    keys = (np.arange(len(counts)) + lowest) * bin
+    nonempty = counts > 0
+    return keys[nonempty], counts[nonempty]
 
 class BasePlot(object):
     """
     BasePlot doesn't actually draw anything, but configures general layout,
-    formats data to a list of (key, value) tuples, and implements the
+    formats data to separate lists of keys and values, and implements the
     `show` and `save` methods.
     """
     grid = False
@@ -68,42 +189,99 @@ class BasePlot(object):
     background = '#eeeeee'
     percentage = False
     legend_location = 'best'
+    # Larger scatter and line plots are rasterized in vector formats (PDF,
+    # SVG), instead of writing one path per point.
+    max_vector_points = 2000
+
+    # Figure drawn by the last `show` or `save`.
+    _figure = None
 
     @staticmethod
     def _format_data(data):
         """
-        Given an arbitrary data set, tries to reshape it to [(key, value)].
+        Given an arbitrary data set, tries to reshape it to ([keys], [values]).
+        Numeric keys and values are returned as NumPy arrays (see `as_array`),
+        shown as lists below.
 
         Accepted formats:
-        - [1, 2, 3] -> [(0, 1), (1, 2), (2, 3)]
-        - [(5, 1), (10, 2), (11, 3)] -> [(5, 1), (10, 2), (11, 3)]
-        - [('a', 1), ('b', 2), ('c', 3)] -> [('a', 1), ('b', 2), ('c', 3)]
-        - {5: 1, 10: 2, 11: 3} -> [(5, 1), (10, 2), (11, 3)]
-        - {'a': 1, 'b': 2, 'c': 3} -> [('a', 1), ('b', 2), ('c', 3)]
-        - [[1, 2, 3], [4, 5, 6], [7, 8, 9]] -> [(None, [1,...]), (None, [4,...]),...]
+        - [1, 2, 3] -> ([0, 1, 2], [1, 2, 3])
+        - [(5, 1), (10, 2), (11, 3)] -> ([5, 10, 11], [1, 2, 3])
+        - [('a', 1), ('b', 2), ('c', 3)] -> (['a', 'b', 'c'], [1, 2, 3])
+        - {5: 1, 10: 2, 11: 3} -> ([5, 10, 11], [1, 2, 3])
+        - {'a': 1, 'b': 2, 'c': 3} -> (['a', 'b', 'c'], [1, 2, 3])
+        - [[1, 2, 3], [4, 5, 6], [7, 8, 9]] -> ([None, None, None], [[1,...], [4,...],...])
         """
         if isinstance(data, dict):
-            # Dictionary.
-            return sorted(data.items())
+            # Dictionary. Sorting only the keys avoids building a tuple per item.
+            keys = sorted(data)
+            return as_array(keys), as_array([data[key] for key in keys])
         elif is_list(data):
             data = list(data)
             if len(data) and is_list(data[0]):
                 if len(data[0]) == 2:
                     # List of (key, value) pairs.
-                    return sorted(data)
+                    keys, values = unzip(sorted(data))
+                    return as_array(keys), as_array(values)
                 else:
                     # Matrix.
-                    return [(None, line) for line in data]
+                    return [None] * len(data), data
             else:
                 # List of values.
-                return list(enumerate(data))
+                return np.arange(len(data)), as_array(data)
         else:
             raise ValueError('Unexpected data type {}'.format(type(data)))
 
     def __init__(self, data, **options):
-        self.data = self._format_data(data)
+        self.data = data
         self._apply_options(options)
 
+    @classmethod
+    def _from_formatted(cls, keys, values, **options):
+        """
+        Creates a plot from keys and values already in the format returned by
+        `_format_data`, skipping a second formatting pass.
+        """
+        self = cls.__new__(cls)
+        self.keys, self.values = keys, values
+        self._apply_options(options)
+        return self
+
+    @property
+    def data(self):
+        """ The plotted data, as a list of (key, value) pairs. """
+        # tolist() gives plain Python numbers instead of NumPy scalars.
+        keys, values = self.keys, self.values
+        if isinstance(keys, np.ndarray):
+            keys = keys.tolist()
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        return list(zip(keys, values))
+
+    @data.setter
+    def data(self, data):
+        self.keys, self.values = self._format_data(data)
+        self._clear_cache()
+
+    def _clear_cache(self):
+        """ Discards everything computed from the current data. """
+        self._figure = None
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            # An option or the data changed (e.g. `plot.ylog = True`), so the
+            # cached figure is outdated.
+            object.__setattr__(self, '_figure', None)
+
+    def invalidate(self):
+        """
+        Forces the next `show` or `save` to draw the plot again. Only needed
+        after changing data in place (e.g. `plot.values[0] = 5`), since
+        assigning options or `plot.data` already does this.
+        """
+        self._clear_cache()
+        return self
+
     def _get_fig_ax(self, fig=None, ax=None):
         if ax:
             return fig, ax
@@ -121,14 +299,25 @@ class BasePlot(object):
                 raise ValueError('Invalid option: {}'.format(option))
             setattr(self, option, value)
 
+    def _get_figure(self):
+        """
+        Returns the figure drawn by the last `show` or `save`, drawing a new
+        one only if the data or the options changed since then.
+        """
+        if self._figure is None:
+            self._draw_plot()
+            self._figure = pyplot.gcf()
+        return self._figure
+
     def _draw_plot(self, fig=None, ax=None):
         """
         Make or configure the `figure` and `plot` instances, with correct
         spacing, ticks, labels, etc.
         """
-        if self.data is not None:
-            keys = [a for a, b in self.data]
-            values = [b for a, b in self.data]
+        keys, values = self.keys, self.values
+        # Data types are decided by the first item alone.
+        first_key = keys[0] if len(keys) else None
+        first_value = values[0] if len(values) else None
 
         fig, ax = self._get_fig_ax(fig, ax)
 
@@ -137,39 +326,40 @@ class BasePlot(object):
         else:
             ax.set_axis_bgcolor(self.background)
 
-        # Hide frame lines on top and right sides.
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-
-        # Ensure ticks only on left and bottom, removing top and right ticks.
-        ax.get_xaxis().tick_bottom()
-        ax.get_yaxis().tick_left()
-
         if self.xlog:
             ax.set_xscale('log')
         if self.ylog:
             ax.set_yscale('log')
 
-        if values and not hasattr(values[0], '__iter__'):
+        if first_value is not None and not hasattr(first_value, '__iter__'):
+            # Matplotlib converts its inputs to arrays on every call, so we do
+            # it only once here.
+            values = np.asarray(values)
             _, values_width = min_max_dif(values)
             ax.values_width = max(values_width, ax.values_width)
             ax.yaxis.set_major_formatter(matplotlib.ticker.FuncFormatter(lambda x, p: format_number(x, ax.values_width, self.yprefix, self.ysuffix, percentage=self.percentage)))
 
-        if keys and not hasattr(keys[0], '__iter__') and keys[0] is not None and not isinstance(keys[0], str):
+        if first_key is not None and not hasattr(first_key, '__iter__') and not isinstance(first_key, str):
             _, keys_width = min_max_dif(keys)
             ax.keys_width = max(keys_width, ax.keys_width)
             ax.xaxis.set_major_formatter(matplotlib.ticker.FuncFormatter(lambda x, p: format_number(x, ax.keys_width, self.xprefix, self.xsuffix)))
 
         # Handle non-numeric data on the x-axis.
-        if keys and isinstance(keys[0], str):
-            # Heuristic to rotate label to fit if necessary.
-            rotation = 45 if len(''.join(keys)) > 80 else 0
+        if isinstance(first_key, str):
             s = sorted(set(keys))
-            num_keys = [s.index(key) for key in keys]
-            ax.set_xticks(num_keys)
-            ax.set_xticklabels(keys, rotation=rotation)
+            indexes = {key: i for i, key in enumerate(s)}
+            num_keys = [indexes[key] for key in keys]
+            # One tick per distinct label, not one per data point.
+            ax.xaxis.set_major_locator(matplotlib.ticker.FixedLocator(range(len(s))))
+            ax.xaxis.set_major_formatter(matplotlib.ticker.FixedFormatter(s))
+            # Heuristic to rotate label to fit if necessary.
+            if len(''.join(s)) > 80:
+                pyplot.setp(ax.get_xticklabels(), rotation=45)
             keys = num_keys
 
+        if first_key is not None:
+            keys = np.asarray(keys)
+
         self._draw(keys, values, ax)
 
         # Must be called *after* drawing the data, otherwise we don't know
@@ -194,9 +384,13 @@ class BasePlot(object):
         """
         self._apply_options(options)
 
-        self._draw_plot()
+        figure = self._get_figure()
+        if not pyplot.fignum_exists(figure.number):
+            # Closed by a previous `show`, so it must be drawn again.
+            self._figure = None
+            figure = self._get_figure()
         pyplot.show()
-        pyplot.close()
+        pyplot.close(figure)
         return self
 
     def save(self, path):
@@ -205,9 +399,11 @@ class BasePlot(object):
         on the extension. PDF format is available and generates vector
         graphics.
         """
-        self._draw_plot()
+        figure = self._get_figure()
         # Remove extraneous whitespace.
-        pyplot.savefig(path, bbox_inches="tight")
+        figure.savefig(path, bbox_inches="tight")
+        # Release it from pyplot, but keep it cached for other saves.
+        pyplot.close(figure)
         return self
 
     def __add__(self, other):
@@ -218,7 +414,15 @@ class BasePlot(object):
 
     @property
     def cmap(self):
-        return pyplot.get_cmap(self.colors)
+        if not isinstance(self.colors, str):
+            # Already a colormap object.
+            return pyplot.get_cmap(self.colors)
+        cmap = colormaps.get(self.colors)
+        if cmap is None:
+            cmap = colormaps[self.colors] = pyplot.get_cmap(self.colors)
+        # A copy, like pyplot.get_cmap returns, so changes made through one
+        # plot don't leak into the others.
+        return copy.copy(cmap)
 
 class MergedPlots(BasePlot):
     def __init__(self, plots):
@@ -237,6 +441,12 @@ class MergedPlots(BasePlot):
         labels, handles = zip(*sorted(zip(labels, handles), key=lambda t: ordered_labels.index(t[0])))
         ax.legend(handles, labels, loc=self.legend_location)
 
+    def _get_figure(self):
+        # The merged plots can change without this one knowing, so the figure
+        # is never reused.
+        self._draw_plot()
+        return pyplot.gcf()
+
     def _draw(self, *args):
         pass
 
@@ -249,12 +459,13 @@ class GridPlots(BasePlot):
 
     def __init__(self, plots):
         self.plots = plots
+        BasePlot.__init__(self, [])
 
     def _draw_plot(self, fig=None, ax=None):
         assert fig is None and ax is None
 
         if len(self.plots) == 1:
-            return self.plots[0].show()
+            return self.plots[0]._draw_plot()
 
         nrows = self.nrows or int(math.sqrt(len(self.plots)))
         ncols = int(math.ceil(len(self.plots) / nrows))
@@ -263,8 +474,11 @@ class GridPlots(BasePlot):
         for ax, p in zip(axes.flat, self.plots):
             p._draw_plot(fig, ax)
 
-        pyplot.show()
-        pyplot.close()
+    def _get_figure(self):
+        # The subplots can change without this one knowing, so the figure is
+        # never reused.
+        self._draw_plot()
+        return pyplot.gcf()
 
     def __or__(self, other):
         return GridPlots(self.plots + [other])
@@ -289,21 +503,50 @@ class Network(BasePlot):
     node_color = 'r'
     size = (8, 8)
 
+    # Graph and node positions, built on first use.
+    _graph = None
+    _pos = None
+
+    def _clear_cache(self):
+        BasePlot._clear_cache(self)
+        self._graph = None
+        self._pos = None
+
     @property
     def graph(self):
         """
         Returns a NetworkX graph object, useful for checking properties.
         """
-        import networkx as nx
-        graph = nx.MultiDiGraph()
+        if self._graph is None:
+            import networkx as nx
+            graph = nx.MultiDiGraph()
 
-        for start, end in self.data:
-            if end is None:
-                graph.add_node(start)
-            else:
-                graph.add_edge(start, end)
+            # Pairs of plain Python objects, not NumPy scalars, as node names.
+            for start, end in self.data:
+                if end is None:
+                    graph.add_node(start)
+                else:
+                    graph.add_edge(start, end)
 
-        return graph
+            self._graph = graph
+        return self._graph
+
+    @property
+    def pos(self):
+        """
+        Returns the {node: (x, y)} positions used to draw the graph.
+        """
+        if self._pos is None:
+            import networkx as nx
+            from networkx.drawing.nx_pydot import graphviz_layout
+
+            # Graphviz is a pain to install in Windows and may not be available.
+            # Spring layout is awful, but at least is guaranteed to work.
+            try:
+                self._pos = graphviz_layout(self.graph)
+            except:
+                self._pos = nx.spring_layout(self.graph, iterations=20)
+        return self._pos
 
     def _draw_dot_plot(self, fig=None, ax=None):
         """
@@ -327,25 +570,18 @@ class Network(BasePlot):
 
     def _draw_plot(self, fig=None, ax=None):
         import networkx as nx
-        from networkx.drawing.nx_pydot import graphviz_layout, pydot_layout
         from matplotlib.patches import FancyArrowPatch
 
         graph = self.graph
+        pos = self.pos
 
-        # Graphviz is a pain to install in Windows and may not be available.
-        # Spring layout is awful, but at least is guaranteed to work.
-        try:
-            pos = graphviz_layout(graph)
-        except:
-            pos = nx.spring_layout(graph, iterations=20)
-            
         fig, ax = self._get_fig_ax(fig, ax)
 
         # We are not plotting actual values, hide both axis.
         ax.axis('off')
 
         # Automatically show labels for small networks.
-        if self.with_labels is None and len(self.data) < 10:
+        if self.with_labels is None and len(self.keys) < 10:
             self.with_labels = True
         
         # Increase node size to fit labels.
@@ -360,15 +596,15 @@ class Network(BasePlot):
         if self.directed:
             # Networkx default "directed" visualization just draws a thicker stub at the end.
             # This code adds actual arrow heads, taking care not to overlap the nodes themselves.
-            for start, end in self.data:
-                if start == end:
-                    continue
-                start_x, start_y = pos[start]
-                end_x, end_y = pos[end]
-                angle = math.atan2(end_y-start_y, end_x-start_x)
-                distance = math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2)
-                end_pos = (end_x - 0.1 * distance * math.cos(angle), end_y - 0.1 * distance * math.sin(angle))
-                ax.add_patch(FancyArrowPatch(posA=(start_x, start_y), posB=end_pos,
+            edges = [(start, end) for start, end in self.data if end is not None and start != end]
+            starts = np.array([pos[start] for start, end in edges], dtype=float).reshape(-1, 2)
+            ends = np.array([pos[end] for start, end in edges], dtype=float).reshape(-1, 2)
+            # Stop each arrow 10% of the edge length before the end node.
+            # Computed for all edges at once, instead of angle and distance
+            # per edge.
+            arrow_ends = ends - 0.1 * (ends - starts)
+            for start_pos, end_pos in zip(starts, arrow_ends):
+                ax.add_patch(FancyArrowPatch(posA=tuple(start_pos), posB=tuple(end_pos),
                                     color='k', arrowstyle=self.arrowstyle,
                                     mutation_scale=30, connectionstyle="arc3"))
 
@@ -413,15 +649,17 @@ class BarPlot(BasePlot):
             # to place at the top of the bar, still inside the fill, but some
             # bars are too short (or negative) and the label must be placed
             # outside.
-            max_height = max(rect.get_height() for rect in rects)
+            # Bar heights are the values themselves, so the maximum is taken
+            # once over the array instead of once per bar. The values width
+            # was already measured by `_draw_plot` for the y-axis formatter.
+            padding = np.max(values) * 0.03
+            max_width = ax.values_width
             for rect in rects:
                 height = rect.get_height()
-                padding = max_height * 0.03
                 if height > padding * 2:
                     y = rect.get_y()+height - padding
                 else:
                     y = rect.get_y()+height + padding * 2
-                _, max_width = min_max_dif(values)
                 value = format_number(rect.get_y() or height, max_width, self.yprefix, self.ysuffix)
                 ax.text(rect.get_x() + rect.get_width()/2., y, value, ha='center', va='top')
 
@@ -438,21 +676,54 @@ class Histogram(BarPlot):
         each class, used to aggregate values, and defaults to an
         algorithmically chosen value with up to `self.max_bins` bins.
         """
+        if isinstance(samples, sequence_types):
+            samples = np.asarray(samples)
+        else:
+            # Generators, sets, etc. Floats are read straight into an array,
+            # instead of going through an intermediate list. Other types, like
+            # int or Fraction, need the list for NumPy to keep them exact.
+            size = len(samples) if hasattr(samples, '__len__') else -1
+            samples = iter(samples)
+            first = list(islice(samples, 1))
+            if first and isinstance(first[0], float):
+                samples = np.fromiter(chain(first, samples), dtype=float, count=size)
+            else:
+                samples = np.asarray(first + list(samples))
         if bin is None:
-            min_dif, max_dif = min_max_dif(set(samples))
-            # Use the smallest difference as bin size, up to a maximum of 40.
-            bin = max(min_dif, max_dif / self.max_bins)
+            min_dif, max_dif = min_max_dif(samples)
+            if max_dif == 0:
+                # All samples are equal, any bin size gives a single bar.
+                bin = 1
+            else:
+                # Use the smallest difference as bin size, up to a maximum of 40.
+                bin = max(min_dif, max_dif / self.max_bins)
 
-        data = {k*bin: v for k, v in Counter(int(s/bin) for s in samples).items()}
+        # Already sorted keys and values, no need for `_format_data`.
+        self.keys, self.values = count(samples, bin)
         self.bars_width = bin
-        BarPlot.__init__(self, data, **options)
+        self._apply_options(options)
 
 class ScatterPlot(BasePlot):
+    """
+    Draws a small circle on the (x, y) position of each data point. Above
+    `max_scatter_points` points, when `mode` is 'auto', or when `mode` is
+    'hexbin', draws the point density on a hexagonal grid instead, which is
+    much faster to render and save.
+    """
     color = None
-    
-    """ Draws a small circle on the (x, y) position of each data point. """
+    mode = 'auto'
+    max_scatter_points = 5000
+    hexbin_gridsize = 64
+
     def _draw(self, keys, values, ax):
-        ax.scatter(keys, values, color=self.color, label=self.title)
+        if self.mode not in ('auto', 'scatter', 'hexbin'):
+            raise ValueError('Invalid mode: {}'.format(self.mode))
+
+        if self.mode == 'hexbin' or (self.mode == 'auto' and len(keys) > self.max_scatter_points):
+            ax.hexbin(keys, values, gridsize=self.hexbin_gridsize, mincnt=1, cmap=self.cmap, label=self.title)
+        else:
+            rasterized = len(keys) > self.max_vector_points
+            ax.scatter(keys, values, color=self.color, label=self.title, rasterized=rasterized)
 
 class LinePlot(BasePlot):
     """
@@ -462,18 +733,42 @@ class LinePlot(BasePlot):
     fill = False
 
     def _draw(self, keys, values, ax):
+        rasterized = len(keys) > self.max_vector_points
         if self.fill:
-            ax.fill_between(keys, values, label=self.title)
+            ax.fill_between(keys, values, label=self.title, rasterized=rasterized)
         else:
-            ax.plot(keys, values, label=self.title)
+            ax.plot(keys, values, label=self.title, rasterized=rasterized)
 
 class MatrixPlot(BasePlot):
     """
     A 2D plot of intensity values. Data must be a list of lists or equivalent.
     `self.colors` is the colormap ( http://matplotlib.org/examples/color/colormaps_reference.html ).
+    If `decimate` is True, matrices with more cells than the axes have pixels
+    are subsampled to screen resolution before drawing.
     """
+    decimate = False
+
     def _draw(self, keys, values, ax):
-        im = ax.imshow(values, interpolation='nearest', cmap=self.cmap)
+        matrix = np.ascontiguousarray(values)
+        if matrix.ndim == 2:
+            # Intensities as float32, instead of letting imshow convert them
+            # to float64. RGB(A) images keep their dtype, since imshow
+            # interprets integer and float colors differently.
+            matrix = matrix.astype(np.float32, copy=False)
+        extent = None
+        if self.decimate:
+            rows, cols = matrix.shape[:2]
+            bbox = ax.get_window_extent()
+            step = int(max(1, rows / bbox.height, cols / bbox.width))
+            if step > 1:
+                matrix = matrix[::step, ::step]
+                # Keep the original cell coordinates, as imshow would place
+                # them for the whole matrix.
+                if matplotlib.rcParams['image.origin'] == 'lower':
+                    extent = (-0.5, cols - 0.5, -0.5, rows - 0.5)
+                else:
+                    extent = (-0.5, cols - 0.5, rows - 0.5, -0.5)
+        im = ax.imshow(matrix, interpolation='nearest', cmap=self.cmap, extent=extent)
         pyplot.colorbar(im, ax=ax)
 
     def _setup_margins(self, keys, values, ax):
@@ -486,19 +781,18 @@ def plot(data, **options):
     some graph types are not selected automatically, such as Histogram
     or Network.
     """
-    data = BasePlot._format_data(data)
-    if not len(data):
-        return LinePlot(data, **options)
-
-    keys = [a for a, b in data]
-    if is_list(data[0][1]) and len(data[0][1]) > 2:
-        return MatrixPlot(data, **options)
-    elif len(keys) != len(set(keys)):
-        return ScatterPlot(data, **options)
-    elif isinstance(data[0][0], str):
-        return BarPlot(data, **options)
+    keys, values = BasePlot._format_data(data)
+    if not len(keys):
+        return LinePlot._from_formatted(keys, values, **options)
+
+    if is_list(values[0]) and len(values[0]) > 2:
+        return MatrixPlot._from_formatted(keys, values, **options)
+    elif has_duplicates(keys):
+        return ScatterPlot._from_formatted(keys, values, **options)
+    elif isinstance(keys[0], str):
+        return BarPlot._from_formatted(keys, values, **options)
     else:
-        return LinePlot(data, **options)
+        return LinePlot._from_formatted(keys, values, **options)
 
 def show_grid(plots, nrows=None):
     """
@@ -508,7 +802,7 @@ def show_grid(plots, nrows=None):
     """
     if is_list(plots[0]):
         nrows = len(plots)
-        plots = sum(plots, [])
+        plots = list(chain.from_iterable(plots))
 
     plots = list(plots)
 
@@ -545,7 +839,7 @@ if __name__ == '__main__':
         plot([(randint(0, 100), i * random()) for i in range(100)]),
         plot([random()-0.5 for i in range(100)]),
         plot([100000+i*random() for i in range(100)], fill=True, grid=True, yprefix='$'),
-        plot([[i^j for i in range(250)] for j in range(150)]),
+        plot(np.bitwise_xor.outer(np.arange(150), np.arange(250))),
         Network([(i, randint(1, 100)) for i in range(100)]),
         Network([(choice('ABCDEFGHI'), choice('ABCDEFGHI')) for i in range(15)], directed=True, with_labels=True),
         Network({'Alice': 'Bob', 'Bob': 'Charlie', 'Charlie': 'Alice', 'Eve': None}),
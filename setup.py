@@ -5,11 +5,8 @@ Usage instructions:
 - If you are developing: `python setup.py sdist bdist --format=zip bdist_wheel --universal`
 """
 
-try:
-    import pypandoc
-    long_description = pypandoc.convert('README.md', 'rst')
-except ImportError:
-    long_description = open('README.rst').read()
+# PyPI renders Markdown directly, no need to convert it with pandoc.
+long_description = open('README.md').read()
 
 from setuptools import setup
 
@@ -19,12 +16,13 @@ setup(
     author='BoppreH',
     author_email='boppreh@gmail.com',
     packages=['sciplot'],
-    install_requires=['matplotlib'],
+    install_requires=['matplotlib>=2.0', 'numpy'],
     url='https://github.com/boppreh/sciplot',
     license='MIT',
     description='Pythonic data visualization tool based on matplotlib',
     keywords = 'science graph plot matplotlib visualization',
     long_description=long_description,
+    long_description_content_type='text/markdown',
 
     classifiers=[
         'Development Status :: 3 - Alpha',